@@ -1,17 +1,25 @@
+import bisect
+import itertools
 import os
+import re
+import shutil
+import subprocess
 import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 # pydub is a required library: pip install pydub
 from pydub import AudioSegment
-from pydub.silence import split_on_silence
 
 # --- Set ffmpeg path to local bin directory ---
 from pydub.utils import which
 FFMPEG_PATH = os.path.join(os.path.dirname(__file__), "bin", "ffmpeg.exe")
 AudioSegment.converter = FFMPEG_PATH if os.path.exists(FFMPEG_PATH) else which("ffmpeg")
 
+# Sample rate used when decoding audio for the waveform display only
+WAVEFORM_SAMPLE_RATE = 8000
+
 # Import UI theme system
 import ui_theme
 from ui_theme import (
@@ -25,9 +33,79 @@ import numpy as np
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 import matplotlib.pyplot as plt
 import pygame
 
+def _ffmpeg_silence_detect(path, min_silence_s, thresh_db=-40):
+    """Run ffmpeg's silencedetect filter over the file and return (silent_ranges_ms, duration_ms)."""
+    proc = subprocess.run(
+        [AudioSegment.converter, '-hide_banner', '-i', path,
+         '-af', f'silencedetect=n={thresh_db}dB:d={min_silence_s}', '-f', 'null', '-'],
+        capture_output=True, encoding='utf-8', errors='replace'  # Tags in the input dump are UTF-8, not the locale
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "ffmpeg silencedetect failed")
+    # The last progress report holds the decoded length, which is exact even for VBR files
+    times = re.findall(r'time=(\d+):(\d+):([\d.]+)', proc.stderr)
+    if not times:
+        raise RuntimeError("Could not read audio duration from ffmpeg")
+    h, m, sec = times[-1]
+    duration_ms = int((int(h) * 3600 + int(m) * 60 + float(sec)) * 1000)
+    ranges = []
+    start_ms = None
+    for kind, value in re.findall(r'silence_(start|end): (-?[\d.]+)', proc.stderr):
+        ms = max(0, int(float(value) * 1000))
+        if kind == 'start':
+            start_ms = ms
+        elif start_ms is not None:
+            ranges.append((start_ms, ms))
+            start_ms = None
+    # Silence running into the end of the file has no silence_end line
+    if start_ms is not None:
+        ranges.append((start_ms, duration_ms))
+    return ranges, duration_ms
+
+def _silence_to_tracks(silent_ranges, duration_ms, keep_silence=200):
+    """Convert silent ranges into (track, start_ms, end_ms) tuples padded by keep_silence, like pydub's split_on_silence."""
+    nonsilent = []
+    prev_end = 0
+    for start, end in silent_ranges:
+        if start > prev_end:
+            nonsilent.append([prev_end, start])
+        prev_end = end
+    if prev_end < duration_ms:
+        nonsilent.append([prev_end, duration_ms])
+    # Pad each range, splitting the difference where padded ranges would overlap
+    for rng in nonsilent:
+        rng[0] = max(0, rng[0] - keep_silence)
+        rng[1] = min(duration_ms, rng[1] + keep_silence)
+    for prev, cur in zip(nonsilent, nonsilent[1:]):
+        if prev[1] > cur[0]:
+            mid = (prev[1] + cur[0]) // 2
+            prev[1] = cur[0] = mid
+    return [(i+1, start, end) for i, (start, end) in enumerate(nonsilent)]
+
+def _build_mipmap(samples, min_len=1024):
+    """Return a list of (mins, maxs) envelopes where level k is the samples decimated by 2**k."""
+    levels = [(samples, samples)]
+    mins = maxs = samples
+    # Each level is built from the previous one, so the whole pyramid costs at most 2N extra
+    while len(mins) // 2 >= min_len:
+        n = len(mins) // 2 * 2
+        mins = mins[:n].reshape(-1, 2).min(axis=1)
+        maxs = maxs[:n].reshape(-1, 2).max(axis=1)
+        levels.append((mins, maxs))
+    return levels
+
+def _envelope(mins, maxs, width_px):
+    """Reduce a (mins, maxs) envelope to width_px min/max bins; return (mins, maxs, bin start indices)."""
+    if len(mins) < 2 * width_px:
+        return mins, maxs, np.arange(len(mins))
+    # Uneven bin edges so every point lands in a bin and the tail of the track is drawn
+    edges = np.linspace(0, len(mins), width_px + 1).astype(int)[:-1]
+    return np.minimum.reduceat(mins, edges), np.maximum.reduceat(maxs, edges), edges
+
 class MP3SplitterApp:
     """
     A desktop application for splitting MP3 files based on silence or manual points.
@@ -54,6 +132,8 @@ class MP3SplitterApp:
 
         # Initialize modern theme and animation system
         self.style, self.anim_manager = ui_theme.initialize_theme(root)
+        # Waveform colors are fixed for the session, so look them up once
+        self._wf_colors = get_waveform_colors()
 
         # --- Member variables to store paths and state ---
         self.source_file_path = tk.StringVar()
@@ -159,10 +239,26 @@ class MP3SplitterApp:
         self.is_paused = False
         self.current_audio_path = None
         self.audio_duration_ms = 0
+        self._ms_to_x_scale = 0.0  # x data units per millisecond of the plotted waveform
+        self._mip = []  # (mins, maxs) envelopes, level k decimated by 2**k
+        self._wave_poly = None
+        self._wave_width = 0  # Axes width in pixels the envelope was binned for
+        self.canvas.get_tk_widget().bind('<Configure>', self.on_waveform_resize, add='+')
         self.split_points = []  # Store split points in ms
-        self.split_lines = []   # Store matplotlib line objects
+        self.split_lc = None    # One LineCollection holding every split line
+        self._add_split_collection()
         self.canvas.mpl_connect('button_press_event', self.on_waveform_click)
         self.playhead_line = None  # For moving playhead
+        self._playhead_after_id = None  # Pending update_playhead callback
+        self._play_t0 = 0.0  # perf_counter() at which playback position 0 started
+        self._paused_at = 0.0
+        # Waveform pixels cached after every full draw so the playhead can be blitted on top
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+        # Decoded audio cached by (path, mtime) so repeated exports of the same file skip ffmpeg
+        self._audio_cache = {}
+        self._audio_cache_lock = threading.Lock()
+        self._auto_split_after_id = None  # Pending debounced auto split
 
         # --- Right-side panel for timestamps ---
         right_panel = ttk.Frame(main_frame, style='Panel.TFrame')
@@ -178,6 +274,8 @@ class MP3SplitterApp:
         self.timestamp_tree.column("start", width=90, anchor='center')
         self.timestamp_tree.column("end", width=90, anchor='center')
         self.timestamp_tree.pack(fill=tk.BOTH, expand=True)
+        self._last_segments = []  # Rows currently shown in timestamp_tree
+        self._mmss_cache = {}  # whole seconds -> "mm:ss" for segment bounds
         
         # Download as ZIP button with enhanced styling
         self.download_zip_button = ttk.Button(right_panel, text="Download as ZIP", command=self.download_segments_zip, style='Primary.TButton')
@@ -212,97 +310,216 @@ class MP3SplitterApp:
         )
         if file_path:
             self.source_file_path.set(file_path)
-            self.status_bar.update_status(f"Selected file: {os.path.basename(file_path)}", 'success')
-            self.plot_waveform(file_path)
             self.current_audio_path = file_path
-            self.auto_split_on_param_change()
-            # Add success animation
-            self.anim_manager.pulse_button(self.play_button, SUCCESS_COLOR, SECONDARY_GREEN)
+            self.status_bar.update_status(f"Loading {os.path.basename(file_path)}...", 'info')
+            self.plot_waveform(file_path)
+
+    def _get_audio(self, path):
+        """Return the decoded AudioSegment for path, decoding only when the file is new or has changed."""
+        key = (path, os.path.getmtime(path))
+        with self._audio_cache_lock:
+            if key not in self._audio_cache:
+                # Only keep the current file decoded; long MP3s take hundreds of MB
+                self._audio_cache.clear()
+                self._audio_cache[key] = AudioSegment.from_mp3(path)
+            return self._audio_cache[key]
+
+    def _find_tracks(self, file_path, min_silence_len):
+        """Detect silence in the file and return (track, start_ms, end_ms) tuples for the non-silent parts."""
+        if min_silence_len <= 0:
+            # No minimum silence means nothing to split on: the whole file is one track
+            return [(1, 0, self.audio_duration_ms)] if self.audio_duration_ms else []
+        # ffmpeg scans the file natively, so the audio never has to be decoded into Python
+        silent_ranges, duration_ms = _ffmpeg_silence_detect(
+            file_path,
+            min_silence_s=min_silence_len / 1000,
+            thresh_db=-40  # Use default threshold
+        )
+        return _silence_to_tracks(silent_ranges, duration_ms, keep_silence=200)
 
     def update_status(self, message, status_type='info'):
         """Update the status bar text with enhanced styling."""
         self.status_bar.update_status(message, status_type)
 
     def plot_waveform(self, file_path):
-        """Load the MP3 file, extract samples, and plot the waveform with enhanced colors."""
+        """Decode the MP3 in a background thread and plot its waveform once the samples are ready."""
+        # The previous file's timing, split points and segments must not be used while the new one decodes
+        self.audio_duration_ms = 0
+        self._ms_to_x_scale = 0.0
+        self.split_points = []
+        self.clear_split_lines()
+        self.blit_overlays()
+        self.show_segments([])
+        # Free the previous file's decoded PCM; long MP3s take hundreds of MB
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+        self.progress_bar.config(mode='indeterminate')
+        self.progress_bar.start(10)
+        threading.Thread(
+            target=self.run_waveform_task,
+            args=(file_path,),
+            daemon=True
+        ).start()
+
+    def _load_samples(self, file_path):
+        """Decode the MP3 through an ffmpeg PCM pipe and return (mono int16 samples, duration in ms). Safe off the Tk thread."""
+        # Let ffmpeg downmix and resample so only a small int16 buffer crosses the pipe
+        proc = subprocess.Popen(
+            [AudioSegment.converter, '-v', 'error', '-i', file_path,
+             '-f', 's16le', '-ac', '1', '-ar', str(WAVEFORM_SAMPLE_RATE), '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        raw, err = proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(err.decode(errors='replace').strip() or "ffmpeg failed to decode the file")
+        samples = np.frombuffer(raw, dtype=np.int16)
+        if samples.size == 0:
+            raise RuntimeError("No audio data found")
+        return samples, samples.size * 1000 // WAVEFORM_SAMPLE_RATE
+
+    def run_waveform_task(self, file_path):
+        """Threaded task to decode the waveform and hand it to the Tk thread for plotting."""
         try:
-            audio = AudioSegment.from_mp3(file_path)
-            samples = np.array(audio.get_array_of_samples())
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
-                samples = samples.mean(axis=1)
-            
-            self.ax.clear()
-            # Use enhanced waveform colors
-            colors = get_waveform_colors()
-            self.ax.plot(samples, color=colors['waveform'], linewidth=0.5)
-            self.ax.set_axis_off()
-            self.figure.tight_layout()
-            self.canvas.draw()
-            
-            self.audio_duration_ms = len(audio)
-            self.split_points = []
-            self.clear_split_lines()
-            # Update time label to show total duration
-            self.time_label.config(text=f"00:00 / {self.ms_to_mmss(self.audio_duration_ms)}")
-            
-            # Add success animation
-            self.anim_manager.pulse_button(self.play_button, SUCCESS_COLOR, SECONDARY_GREEN)
-            
+            samples, duration_ms = self._load_samples(file_path)
+            # Precompute min/max envelopes at power-of-two resolutions once per file. int8 keeps all the
+            # detail visible on screen at half the memory, and the shift preserves min/max ordering
+            mip = _build_mipmap((samples >> 8).astype(np.int8))
+            self.root.after(0, self._render_waveform, file_path, mip, duration_ms)
         except Exception as e:
-            self.ax.clear()
-            self.ax.text(0.5, 0.5, f"Error loading waveform:\n{e}", ha='center', va='center', color=ERROR_COLOR)
-            self.ax.set_axis_off()
-            self.canvas.draw()
-            self.audio_duration_ms = 0
-            self.split_points = []
-            self.clear_split_lines()
-            self.time_label.config(text="00:00 / 00:00")
-            self.status_bar.update_status(f"Error loading file: {e}", 'error')
+            self.root.after(0, self._render_waveform_error, file_path, e)
+
+    def _stop_load_progress(self):
+        """Return the progress bar to its idle determinate state."""
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate')
+        self.progress_bar['value'] = 0
+
+    def _render_waveform(self, file_path, mip, duration_ms):
+        """Plot a decoded waveform and reset the split state for it. Tk thread only."""
+        if file_path != self.current_audio_path:
+            return  # A newer file was selected while this one was decoding
+        self._stop_load_progress()
+        self._mip = mip
+        total_samples = len(mip[0][0])
+
+        self.ax.clear()
+        self.playhead_line = None  # Cleared along with the axes
+        self._add_split_collection()
+        self._wave_poly = None
+        self._wave_width = 0
+        self.ax.set_xlim(0, total_samples - 1)
+        self.ax.set_axis_off()
+        # Lay out first so the envelope is binned for the final axes width
+        self.figure.tight_layout()
+        self.draw_envelope()
+        self.canvas.draw()
+        
+        # x data is in 8 kHz sample units at every level, so split lines survive level changes
+        self._ms_to_x_scale = (total_samples - 1) / duration_ms if duration_ms else 0.0
+        self.audio_duration_ms = duration_ms
+        self._mmss_cache.clear()
+        self.split_points = []
+        self.clear_split_lines()
+        # Update time label to show total duration
+        self.time_label.config(text=f"00:00 / {self.ms_to_mmss(self.audio_duration_ms)}")
+        self.status_bar.update_status(f"Selected file: {os.path.basename(file_path)}", 'success')
+        self.auto_split_on_param_change()
+        
+        # Add success animation
+        self.anim_manager.pulse_button(self.play_button, SUCCESS_COLOR, SECONDARY_GREEN)
+
+    def _render_waveform_error(self, file_path, e):
+        """Show a waveform decode error in place of the plot. Tk thread only."""
+        if file_path != self.current_audio_path:
+            return
+        self._stop_load_progress()
+        self.ax.clear()
+        self._add_split_collection()
+        self.ax.text(0.5, 0.5, f"Error loading waveform:\n{e}", ha='center', va='center', color=ERROR_COLOR)
+        self.ax.set_axis_off()
+        self.canvas.draw()
+        self.playhead_line = None
+        self._mip = []
+        self._ms_to_x_scale = 0.0
+        self.audio_duration_ms = 0
+        self.split_points = []
+        self.clear_split_lines()
+        self.show_segments([])
+        self.time_label.config(text="00:00 / 00:00")
+        self.status_bar.update_status(f"Error loading file: {e}", 'error')
+
+    def draw_envelope(self):
+        """Plot one min/max pair per axes pixel; return True if the envelope was redrawn."""
+        width = max(int(self.ax.bbox.width), 100)
+        # Small width changes don't make a visible difference, so keep the current envelope
+        if self._wave_width and abs(width - self._wave_width) <= self._wave_width // 20:
+            return False
+        # Coarsest level that still has at least one point per pixel: level k holds floor(N / 2**k)
+        # points, so it is floor(log2(N // width)), clamped to the pyramid. Then a final per-pixel reduction
+        ratio = len(self._mip[0][0]) // width
+        level = min(max(ratio.bit_length() - 1, 0), len(self._mip) - 1)
+        mins, maxs, starts = _envelope(*self._mip[level], width)
+        x = starts << level
+        if self._wave_poly is not None:
+            self._wave_poly.remove()
+        self._wave_poly = self.ax.fill_between(x, mins, maxs, color=self._wf_colors['waveform'], linewidth=0.5)
+        self._wave_width = width
+        return True
+
+    def on_waveform_resize(self, event):
+        """Re-bin the envelope from the cached mipmap when the canvas width changes."""
+        if self._mip and self.draw_envelope():
+            self.canvas.draw_idle()
 
     def on_waveform_click(self, event):
         """Handle mouse click on the waveform to add a manual split point (red line)."""
-        if event.inaxes != self.ax or self.audio_duration_ms == 0:
+        if event.inaxes != self.ax or self.audio_duration_ms == 0 or not self._ms_to_x_scale:
             return
         # Convert x coordinate to ms
-        xdata = event.xdata
-        total_samples = self.ax.lines[0].get_xdata()[-1] if self.ax.lines else 1
-        ms = int((xdata / total_samples) * self.audio_duration_ms)
+        ms = int(event.xdata / self._ms_to_x_scale)
         ms = max(0, min(ms, self.audio_duration_ms))
-        # Add split point and vertical line with enhanced colors
-        self.split_points.append(ms)
-        colors = get_waveform_colors()
-        line = self.ax.axvline(x=xdata, color=colors['split_line'], linestyle='--', linewidth=2)
-        self.split_lines.append(line)
-        self.canvas.draw()
+        if not self.add_split_point(ms):
+            self.status_bar.update_status(f"Split point at {self.ms_to_mmss(ms)} already exists or is at a track boundary", 'warning')
+            return
         # Update split segments panel
         self.update_manual_split_segments()
         # Add visual feedback
         self.anim_manager.pulse_button(self.manual_split_button, SECONDARY_RED, SPLIT_LINE_ACTIVE)
 
+    def add_split_point(self, ms):
+        """Insert a split point into the sorted split_points list and draw its line; return False if it was not added."""
+        # Points on the track boundaries or already present don't create a new segment
+        if not 0 < ms < self.audio_duration_ms:
+            return False
+        idx = bisect.bisect_left(self.split_points, ms)
+        if idx < len(self.split_points) and self.split_points[idx] == ms:
+            return False
+        self.split_points.insert(idx, ms)
+        self.update_split_lines()
+        return True
+
+    def _add_split_collection(self):
+        """Attach an empty split-line collection to the axes; ax.clear() drops it along with everything else."""
+        # x in data units, y spanning the full axes height; animated so it is blitted like the playhead
+        self.split_lc = LineCollection(
+            [], colors=self._wf_colors['split_line'], linestyles='--', linewidths=2,
+            transform=self.ax.get_xaxis_transform(), animated=True
+        )
+        self.ax.add_collection(self.split_lc, autolim=False)
+
+    def update_split_lines(self):
+        """Rebuild the split-line segments from split_points and blit them."""
+        scale = self._ms_to_x_scale
+        self.split_lc.set_segments([[(ms * scale, 0), (ms * scale, 1)] for ms in self.split_points])
+        self.blit_overlays()
+
     def clear_split_lines(self):
-        """Remove all manual split lines from the waveform."""
-        for line in getattr(self, 'split_lines', []):
-            try:
-                line.remove()
-            except Exception:
-                pass
-        self.split_lines = []
+        """Remove all manual split lines from the waveform by emptying the collection in place."""
+        self.split_lc.set_segments([])
 
     def add_manual_splits(self):
         """Add manual split points to the split segments panel."""
-        # Clear the timestamp tree before adding
-        for item in self.timestamp_tree.get_children():
-            self.timestamp_tree.delete(item)
-        # Sort and deduplicate split points, add 0 and end if not present
-        points = sorted(set([0] + self.split_points + ([self.audio_duration_ms] if self.audio_duration_ms else [])))
-        # Remove points outside duration
-        points = [p for p in points if 0 <= p <= self.audio_duration_ms]
-        # Show as segments (start, end)
-        for i in range(len(points)-1):
-            start = points[i]
-            end = points[i+1]
-            self.timestamp_tree.insert('', 'end', values=(i+1, self.ms_to_mmss(start), self.ms_to_mmss(end)))
+        self.show_segments(self._manual_segments())
         
         # Add success feedback
         self.status_bar.update_status(f"Added {len(self.split_points)} manual split points", 'success')
@@ -315,12 +532,14 @@ class MP3SplitterApp:
                     # Resume from pause
                     pygame.mixer.music.unpause()
                     self.is_paused = False
+                    self._play_t0 += time.perf_counter() - self._paused_at
                     self.start_playhead()
                     self.status_bar.update_status("Resumed playback", 'info')
                 else:
                     # Start new playback
                     pygame.mixer.music.load(self.current_audio_path)
                     pygame.mixer.music.play()
+                    self._play_t0 = time.perf_counter()
                     self.start_playhead()
                     self.status_bar.update_status("Started playback", 'success')
             except Exception as e:
@@ -332,12 +551,15 @@ class MP3SplitterApp:
         if pygame.mixer.music.get_busy():
             pygame.mixer.music.pause()
             self.is_paused = True
+            self._paused_at = time.perf_counter()
+            self.cancel_playhead_update()
             self.status_bar.update_status("Paused playback", 'warning')
             # Don't remove the playhead - let it stay at current position
         elif self.is_paused:
             # If already paused, resume playback
             pygame.mixer.music.unpause()
             self.is_paused = False
+            self._play_t0 += time.perf_counter() - self._paused_at
             self.start_playhead()
             self.status_bar.update_status("Resumed playback", 'info')
 
@@ -345,6 +567,7 @@ class MP3SplitterApp:
         """Stop the audio playback and remove the playhead."""
         pygame.mixer.music.stop()
         self.is_paused = False
+        self.cancel_playhead_update()
         self.remove_playhead()
         # Reset time label
         self.time_label.config(text=f"00:00 / {self.ms_to_mmss(self.audio_duration_ms)}")
@@ -353,35 +576,46 @@ class MP3SplitterApp:
     def start_playhead(self):
         """Start the playhead animation if not paused."""
         if not self.is_paused:
+            # Never run two update loops at once, e.g. when Play is pressed twice
+            self.cancel_playhead_update()
             self.update_playhead()
 
+    def cancel_playhead_update(self):
+        """Cancel any scheduled playhead update so no callback runs while paused or stopped."""
+        if self._playhead_after_id is not None:
+            self.canvas.get_tk_widget().after_cancel(self._playhead_after_id)
+            self._playhead_after_id = None
+
     def update_playhead(self):
         """Update the playhead line position according to playback and update the time label."""
-        if not pygame.mixer.music.get_busy() and not self.is_paused:
+        self._playhead_after_id = None
+        if self.is_paused:
+            # Paused: leave the playhead where it is and don't reschedule
+            return
+        if not pygame.mixer.music.get_busy():
             self.remove_playhead()
             # Reset time label to 0 when stopped
             self.time_label.config(text=f"00:00 / {self.ms_to_mmss(self.audio_duration_ms)}")
             return
-        pos_ms = pygame.mixer.music.get_pos()
-        if pos_ms < 0:
-            pos_ms = 0
+        # Position from the wall clock since playback started (pauses are shifted out of _play_t0),
+        # so the mixer is only queried for end-of-playback
+        pos_ms = int((time.perf_counter() - self._play_t0) * 1000)
         if self.audio_duration_ms == 0:
+            # Waveform still decoding: keep polling until its duration and scale are known
+            self._playhead_after_id = self.canvas.get_tk_widget().after(33, self.update_playhead)
             return
+        pos_ms = max(0, min(pos_ms, self.audio_duration_ms))
         # Map ms to xdata
-        total_samples = self.ax.lines[0].get_xdata()[-1] if self.ax.lines else 1
-        x = (pos_ms / self.audio_duration_ms) * total_samples
+        x = pos_ms * self._ms_to_x_scale
         # Draw or move playhead with enhanced colors
-        colors = get_waveform_colors()
         if self.playhead_line is None:
-            self.playhead_line = self.ax.axvline(x=x, color=colors['playhead'], linewidth=2)
+            self.playhead_line = self.ax.axvline(x=x, color=self._wf_colors['playhead'], linewidth=2, animated=True)
         else:
             self.playhead_line.set_xdata([x, x])
-        self.canvas.draw()
+        self.blit_overlays()
         # Update time label
         self.time_label.config(text=f"{self.ms_to_mmss(pos_ms)} / {self.ms_to_mmss(self.audio_duration_ms)}")
-        # Only continue updating if not paused
-        if not self.is_paused:
-            self.canvas.get_tk_widget().after(50, self.update_playhead)
+        self._playhead_after_id = self.canvas.get_tk_widget().after(33, self.update_playhead)
 
     def remove_playhead(self):
         """Remove the playhead line from the waveform."""
@@ -391,7 +625,26 @@ class MP3SplitterApp:
             except Exception:
                 pass
             self.playhead_line = None
-        self.canvas.draw()
+        self.blit_overlays()
+
+    def on_canvas_draw(self, event):
+        """Cache the freshly drawn waveform background and redraw the animated overlays over it."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.split_lc)
+        if self.playhead_line is not None:
+            self.ax.draw_artist(self.playhead_line)
+
+    def blit_overlays(self):
+        """Redraw only the split lines and playhead over the cached waveform background."""
+        if self._bg is None:
+            # No background yet: queue one full draw, which also paints the overlays via on_canvas_draw
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.split_lc)
+        if self.playhead_line is not None:
+            self.ax.draw_artist(self.playhead_line)
+        self.canvas.blit(self.ax.bbox)
 
     def start_splitting_thread(self):
         """Validate input and start the splitting process in a separate thread."""
@@ -418,9 +671,6 @@ class MP3SplitterApp:
         # Disable the button to prevent multiple clicks
         self.split_button.config(state=tk.DISABLED)
         self.progress_bar['value'] = 0
-        # Clear the timestamp tree before splitting
-        for item in self.timestamp_tree.get_children():
-            self.timestamp_tree.delete(item)
         # Run the splitting task in a new thread
         threading.Thread(
             target=self.run_split_task,
@@ -431,39 +681,22 @@ class MP3SplitterApp:
     def run_split_task(self, file_path, min_silence_len):
         """Split the MP3 file on silence and update the split segments panel."""
         try:
-            self.update_status("Loading audio file... this may take a moment.", 'info')
-            audio = AudioSegment.from_mp3(file_path)
             self.update_status(f"Splitting on silence (min: {min_silence_len}ms)...", 'info')
-            chunks = split_on_silence(
-                audio,
-                min_silence_len=min_silence_len,
-                silence_thresh=-40,  # Use default threshold
-                keep_silence=200,
-                seek_step=1
-            )
-            if not chunks:
+            timestamps = self._find_tracks(file_path, min_silence_len)
+            if not timestamps:
+                self.root.after(0, self.show_segments, [])
                 self.update_status("No silence found to split on. Try adjusting parameters.", 'warning')
                 messagebox.showwarning("No Tracks Found", "Could not find any tracks based on the current silence parameters. Please try a shorter silence length.")
                 self.split_button.config(state=tk.NORMAL)
                 return
-            total_chunks = len(chunks)
+            total_chunks = len(timestamps)
             self.progress_bar['maximum'] = total_chunks
-            # --- Calculate and display timestamps ---
-            timestamps = []
-            current_pos = 0
-            for i, chunk in enumerate(chunks):
-                start_ms = current_pos
-                end_ms = current_pos + len(chunk)
-                timestamps.append((i+1, start_ms, end_ms))
-                current_pos = end_ms
             # Update the Treeview in the main thread
-            def update_tree():
-                for track, start, end in timestamps:
-                    self.timestamp_tree.insert('', 'end', values=(track, self.ms_to_mmss(start), self.ms_to_mmss(end)))
-            self.root.after(0, update_tree)
+            self.root.after(0, self.show_segments, timestamps)
             self.update_status(f"Splitting complete! Found {total_chunks} tracks.", 'success')
             messagebox.showinfo("Success", f"Splitting complete!\n\nFound {total_chunks} tracks.")
         except Exception as e:
+            self.root.after(0, self.show_segments, [])
             error_message = f"An error occurred: {e}"
             self.update_status(error_message, 'error')
             messagebox.showerror("Critical Error", f"{error_message}\n\nTroubleshooting:\n1. Ensure the file is a valid MP3.\n2. CRITICAL: Ensure FFmpeg is installed and in your system's PATH.")
@@ -473,7 +706,14 @@ class MP3SplitterApp:
             self.progress_bar['value'] = 0
 
     def auto_split_on_param_change(self):
+        """Schedule an auto split, debounced so bursts of edits trigger a single split."""
+        if self._auto_split_after_id is not None:
+            self.root.after_cancel(self._auto_split_after_id)
+        self._auto_split_after_id = self.root.after(400, self._start_auto_split)
+
+    def _start_auto_split(self):
         """Automatically split the MP3 file based on current parameters and update the split segments panel."""
+        self._auto_split_after_id = None
         source_file = self.source_file_path.get()
         if not source_file:
             return
@@ -493,9 +733,6 @@ class MP3SplitterApp:
         except ValueError:
             self.update_status("Invalid splitting parameter. Please use mm:ss format.", 'error')
             return
-        # Clear the timestamp tree before splitting
-        for item in self.timestamp_tree.get_children():
-            self.timestamp_tree.delete(item)
         # Run splitting in a thread to avoid UI freeze
         threading.Thread(
             target=self.run_auto_split_task,
@@ -507,43 +744,64 @@ class MP3SplitterApp:
         """Threaded task to auto split and update the split segments panel."""
         try:
             self.update_status("Splitting on silence (auto)...", 'info')
-            audio = AudioSegment.from_mp3(file_path)
-            chunks = split_on_silence(
-                audio,
-                min_silence_len=min_silence_len,
-                silence_thresh=-40,  # Use default threshold
-                keep_silence=200,
-                seek_step=1
-            )
-            if not chunks:
+            timestamps = self._find_tracks(file_path, min_silence_len)
+            if not timestamps:
+                self.root.after(0, self.show_segments, [])
                 self.update_status("No silence found to split on. Try adjusting parameters.", 'warning')
                 return
-            # --- Calculate and display timestamps ---
-            timestamps = []
-            current_pos = 0
-            for i, chunk in enumerate(chunks):
-                start_ms = current_pos
-                end_ms = current_pos + len(chunk)
-                timestamps.append((i+1, start_ms, end_ms))
-                current_pos = end_ms
             def update_tree():
-                for track, start, end in timestamps:
-                    self.timestamp_tree.insert('', 'end', values=(track, self.ms_to_mmss(start), self.ms_to_mmss(end)))
+                self.show_segments(timestamps)
                 self.update_status(f"Auto split complete! Found {len(timestamps)} tracks.", 'success')
             self.root.after(0, update_tree)
         except Exception as e:
+            self.root.after(0, self.show_segments, [])
             self.update_status(f"Auto split error: {e}", 'error')
 
     def ms_to_mmss(self, ms):
         """Convert milliseconds to mm:ss string format."""
-        seconds = ms // 1000
-        mins = seconds // 60
-        secs = seconds % 60
+        mins, secs = divmod(ms // 1000, 60)
         return f"{mins:02d}:{secs:02d}"
 
+    def _mmss(self, ms):
+        """Cached ms_to_mmss for segment bounds, which repeat across panel updates."""
+        # Keyed by whole second, the only precision shown, so the cache is bounded by the track length
+        sec = ms // 1000
+        text = self._mmss_cache.get(sec)
+        if text is None:
+            text = self._mmss_cache[sec] = self.ms_to_mmss(ms)
+        return text
+
+    def show_segments(self, timestamps):
+        """Show (track, start_ms, end_ms) rows in the split segments panel, touching only rows that changed."""
+        fmt = self._mmss
+        # Format every row up front so the Tk calls run back to back
+        rows = [(track, fmt(start), fmt(end)) for track, start, end in timestamps]
+        tree = self.timestamp_tree
+        old_rows = self._last_segments
+        # Rows use deterministic iids so the previous result can be patched in place
+        for i, (old, values) in enumerate(zip(old_rows, rows)):
+            if old != values:
+                tree.item(f"seg_{i}", values=values)
+        if not old_rows:
+            # Tk walks the sibling list to find 'end' on every insert, so fill an empty panel
+            # back to front at index 0 instead
+            for i in range(len(rows) - 1, -1, -1):
+                tree.insert('', 0, iid=f"seg_{i}", values=rows[i])
+        else:
+            for i in range(len(old_rows), len(rows)):
+                tree.insert('', 'end', iid=f"seg_{i}", values=rows[i])
+        if len(old_rows) > len(rows):
+            tree.delete(*[f"seg_{i}" for i in range(len(rows), len(old_rows))])
+        self._last_segments = rows
+
     def download_segments_zip(self):
         """Export all split segments as MP3s, package them into a ZIP, and prompt the user to save the ZIP file."""
-        import tempfile, shutil, zipfile
+        import io, zipfile
+        from concurrent.futures import ThreadPoolExecutor
+        if not self.audio_duration_ms:
+            # Nothing loaded, or the selected file is still decoding or failed to load
+            messagebox.showerror("Error", "No audio loaded.")
+            return
         # Get segments from Treeview
         segments = []
         for item in self.timestamp_tree.get_children():
@@ -559,25 +817,25 @@ class MP3SplitterApp:
         if not zip_path:
             return
         # Load audio
-        audio = AudioSegment.from_mp3(self.current_audio_path)
-        # Export segments to temp dir
-        temp_dir = tempfile.mkdtemp()
-        mp3_paths = []
-        for track, start_str, end_str in segments:
-            start_ms = self.mmss_to_ms(start_str)
-            end_ms = self.mmss_to_ms(end_str)
-            segment = audio[start_ms:end_ms]
-            out_path = os.path.join(temp_dir, f'track_{track:02d}.mp3')
-            segment.export(out_path, format='mp3', bitrate='192k')
-            mp3_paths.append(out_path)
-        # Create ZIP
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            for mp3 in mp3_paths:
-                zipf.write(mp3, os.path.basename(mp3))
-        # Clean up
-        shutil.rmtree(temp_dir)
-        messagebox.showinfo("Success", f"Exported {len(mp3_paths)} segments to ZIP:\n{zip_path}")
-        self.status_bar.update_status(f"Exported {len(mp3_paths)} segments to ZIP", 'success')
+        audio = self._get_audio(self.current_audio_path)
+        tasks = [(track, self.mmss_to_ms(start_str), self.mmss_to_ms(end_str)) for track, start_str, end_str in segments]
+
+        def encode(task):
+            # Each export runs its own ffmpeg process, so segments encode in parallel
+            track, start_ms, end_ms = task
+            buf = io.BytesIO()
+            audio[start_ms:end_ms].export(buf, format='mp3', bitrate='192k')
+            return f'track_{track:02d}.mp3', buf.getvalue()
+
+        # MP3 is already compressed, so store entries as-is and write each one as soon as it is encoded
+        exported = 0
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zipf, \
+                ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            for name, data in executor.map(encode, tasks):
+                zipf.writestr(name, data)
+                exported += 1
+        messagebox.showinfo("Success", f"Exported {exported} segments to ZIP:\n{zip_path}")
+        self.status_bar.update_status(f"Exported {exported} segments to ZIP", 'success')
         # Add success animation
         self.anim_manager.pulse_button(self.download_zip_button, SUCCESS_COLOR, SECONDARY_GREEN)
 
@@ -597,13 +855,12 @@ class MP3SplitterApp:
         # Stop any playing audio
         pygame.mixer.music.stop()
         self.is_paused = False
-        # Remove black playhead line
-        self.remove_playhead()
+        self.cancel_playhead_update()
         # Clear red split lines and reset split points
         self.split_points = []
         self.clear_split_lines()
-        # Redraw the canvas
-        self.canvas.draw()
+        # Remove black playhead line; its blit also repaints the now empty split lines
+        self.remove_playhead()
         # Reset time label
         self.time_label.config(text=f"00:00 / {self.ms_to_mmss(self.audio_duration_ms)}")
         self.reset_split_segments_panel()
@@ -632,73 +889,72 @@ class MP3SplitterApp:
             return
         ms = max(0, min(ms, self.audio_duration_ms))
         # Add split point and vertical line if not already present
-        if ms not in self.split_points:
-            self.split_points.append(ms)
-            total_samples = self.ax.lines[0].get_xdata()[-1] if self.ax.lines else 1
-            x = (ms / self.audio_duration_ms) * total_samples
-            colors = get_waveform_colors()
-            line = self.ax.axvline(x=x, color=colors['split_line'], linestyle='--', linewidth=2)
-            self.split_lines.append(line)
-            self.canvas.draw()
+        if not self.add_split_point(ms):
+            self.status_bar.update_status(f"Split point at {self.ms_to_mmss(ms)} already exists or is at a track boundary", 'warning')
+            return
         # Update split segments panel
         self.update_manual_split_segments()
         self.status_bar.update_status(f"Added split point at {self.ms_to_mmss(ms)}", 'success')
 
     def update_manual_split_segments(self):
         """Update the split segments panel based on manual split points."""
-        # Clear the timestamp tree before adding
-        for item in self.timestamp_tree.get_children():
-            self.timestamp_tree.delete(item)
-        # Sort and deduplicate split points, add 0 and end if not present
-        points = sorted(set([0] + self.split_points + ([self.audio_duration_ms] if self.audio_duration_ms else [])))
-        # Remove points outside duration
-        points = [p for p in points if 0 <= p <= self.audio_duration_ms]
-        # Show as segments (start, end)
-        for i in range(len(points)-1):
-            start = points[i]
-            end = points[i+1]
-            self.timestamp_tree.insert('', 'end', values=(i+1, self.ms_to_mmss(start), self.ms_to_mmss(end)))
+        self.show_segments(self._manual_segments())
+
+    def _manual_segments(self):
+        """Return (track, start_ms, end_ms) tuples for the segments between the manual split points."""
+        if not self.audio_duration_ms:
+            return []
+        # split_points is kept sorted, unique and strictly inside the track, so just add the ends
+        starts = itertools.chain((0,), self.split_points)
+        ends = itertools.chain(self.split_points, (self.audio_duration_ms,))
+        return [(i+1, start, end) for i, (start, end) in enumerate(zip(starts, ends))]
 
     def refresh_split_parameters(self):
         """Reset splitting parameters and manual split points to initial state."""
         self.min_silence_entry.delete(0, tk.END)
         self.min_silence_entry.insert(0, "00:00")
         self.split_points = []
+        self._mmss_cache.clear()
         self.clear_split_lines()
         self.reset_split_segments_panel()
-        self.canvas.draw()
+        self.blit_overlays()
         self.status_bar.update_status("Reset all parameters", 'info')
 
     def reset_split_segments_panel(self):
         """Reset the split segments panel to initial state: only full segment if audio loaded, else empty."""
-        for item in self.timestamp_tree.get_children():
-            self.timestamp_tree.delete(item)
-        if self.audio_duration_ms:
-            self.timestamp_tree.insert('', 'end', values=(1, self.ms_to_mmss(0), self.ms_to_mmss(self.audio_duration_ms)))
+        self.show_segments([(1, 0, self.audio_duration_ms)] if self.audio_duration_ms else [])
+
+def _check_ffmpeg(root):
+    """Report a missing FFmpeg. Runs in a background thread so the window appears immediately."""
+    # AudioSegment.converter is the bundled bin/ffmpeg.exe or whatever ffmpeg is on the PATH
+    converter = AudioSegment.converter
+    if converter and (os.path.exists(converter) or shutil.which(converter)):
+        return
+    print("--- STARTUP ERROR ---")
+    print("Could not find FFmpeg. This program requires FFmpeg to work.")
+    print("Please download it from https://ffmpeg.org/download.html")
+    print("Then, add its 'bin' folder to your system's PATH environment variable.")
+    print("-----------------------\n")
+    # Show a pop-up error as well, from the Tk thread, then exit since FFmpeg is a critical dependency
+    root.after(0, _show_ffmpeg_error, root)
+
+def _show_ffmpeg_error(root):
+    """Show the missing-FFmpeg dialog over the existing window and close the application."""
+    messagebox.showerror(
+        "FFmpeg Not Found",
+        "This program requires FFmpeg to function.\n\nPlease download it from ffmpeg.org and add it to your system's PATH.",
+        parent=root
+    )
+    root.destroy()
+
+def _schedule_ffmpeg_check(root):
+    """Start the FFmpeg check in the background so startup isn't blocked."""
+    threading.Thread(target=_check_ffmpeg, args=(root,), daemon=True).start()
 
 if __name__ == '__main__':
-    # --- Check for FFmpeg before starting the GUI ---
-    # This is a good practice to give an early warning if dependencies are missing.
-    try:
-        # A simple check to see if pydub can find ffmpeg
-        AudioSegment.from_mp3 # This line will raise an exception if ffmpeg is not found
-    except Exception as e:
-         print("--- STARTUP ERROR ---")
-         print("Could not find FFmpeg. This program requires FFmpeg to work.")
-         print("Please download it from https://ffmpeg.org/download.html")
-         print("Then, add its 'bin' folder to your system's PATH environment variable.")
-         print("-----------------------\n")
-         # Show a pop-up error as well
-         root = tk.Tk()
-         root.withdraw() # Hide the main window
-         messagebox.showerror(
-             "FFmpeg Not Found",
-             "This program requires FFmpeg to function.\n\nPlease download it from ffmpeg.org and add it to your system's PATH."
-         )
-         # Exit if the critical dependency is missing.
-         exit()
-
     # --- Start the Application ---
     app_root = tk.Tk()
     app = MP3SplitterApp(app_root)
-    app_root.mainloop()
\ No newline at end of file
+    # Check for FFmpeg off the startup path and warn if dependencies are missing
+    _schedule_ffmpeg_check(app_root)
+    app_root.mainloop()
@@ -5,8 +5,9 @@ Provides modern styling, colors, and interactive elements for enhanced user expe
 
 import tkinter as tk
 from tkinter import ttk
-import math
 import time
+from functools import lru_cache
+from types import MappingProxyType
 
 # ============================================================================
 # COLOR PALETTE - Modern, Professional Theme
@@ -205,97 +206,131 @@ def apply_modern_theme(style: ttk.Style):
 # ANIMATION HELPERS
 # ============================================================================
 
+class Animation:
+    """A time-based animation advanced by AnimationManager.tick()."""
+    
+    def __init__(self, duration, on_update, on_done=None):
+        self.duration = max(duration, 1) / 1000.0
+        self.elapsed = 0.0
+        self.on_update = on_update
+        self.on_done = on_done
+    
+    def update(self, dt):
+        """Advance by dt seconds and apply the new progress. Returns False once finished."""
+        self.elapsed += dt
+        progress = min(self.elapsed / self.duration, 1.0)
+        self.on_update(progress)
+        if progress >= 1.0:
+            if self.on_done:
+                self.on_done()
+            return False
+        return True
+
 class AnimationManager:
     """Manages smooth animations and transitions."""
     
     def __init__(self, root):
         self.root = root
         self.animations = {}
+        # All running animations share one ~60 Hz timer instead of scheduling their own
+        self._anims = []
+        self._last = 0.0
+        self._tick_id = None
+    
+    def add(self, animation):
+        """Apply the first frame of an animation and start the shared timer if it isn't running."""
+        if not animation.update(0.0):
+            return
+        self._anims.append(animation)
+        if self._tick_id is None:
+            self._last = time.perf_counter()
+            self._tick_id = self.root.after(16, self.tick)
+    
+    def tick(self):
+        """Advance every running animation by the elapsed time and drop the finished ones."""
+        now = time.perf_counter()
+        dt = now - self._last
+        self._last = now
+        running = []
+        for animation in self._anims:
+            try:
+                if animation.update(dt):
+                    running.append(animation)
+            except tk.TclError:
+                pass  # Widget was destroyed mid-animation
+            except Exception:
+                pass  # A failing callback only ends its own animation, never the shared timer
+        self._anims = running
+        self._tick_id = self.root.after(16, self.tick) if running else None
     
     def fade_in(self, widget, duration=300, callback=None):
         """Fade in a widget with smooth opacity transition."""
-        widget.attributes('-alpha', 0.0) if hasattr(widget, 'attributes') else None
+        if not hasattr(widget, 'attributes'):
+            # Only toplevel windows support alpha; still honour the callback
+            if callback:
+                self.root.after(duration, callback)
+            return
         
-        def animate(alpha=0.0):
-            if alpha < 1.0:
-                if hasattr(widget, 'attributes'):
-                    widget.attributes('-alpha', alpha)
-                alpha += 0.1
-                self.root.after(30, lambda: animate(alpha))
-            else:
-                if hasattr(widget, 'attributes'):
-                    widget.attributes('-alpha', 1.0)
-                if callback:
-                    callback()
+        def apply(progress):
+            widget.attributes('-alpha', progress)
         
-        animate()
+        self.add(Animation(duration, apply, callback))
     
     def pulse_button(self, button, color1=PRIMARY_BLUE, color2=PRIMARY_LIGHT, duration=500):
         """Create a pulsing effect on a button."""
+        # Three flashes, each lasting duration/6
+        flashes = 3
+        last_step = [-1]
         # Check if it's a ttk button or tk button
         if isinstance(button, ttk.Button):
             # For ttk buttons, we can't easily change background color
-            # So we'll create a visual pulse effect by briefly changing the style
-            original_style = button.cget('style')
-            
-            def pulse(count=0):
-                if count < 3:  # Pulse 3 times
-                    # Create temporary highlight effect
-                    button.state(['pressed'] if count % 2 == 0 else ['!pressed'])
-                    self.root.after(duration//6, lambda: pulse(count + 1))
-                else:
-                    button.state(['!pressed'])
+            # So we'll create a visual pulse effect by briefly toggling the pressed state
+            def apply(progress):
+                step = min(int(progress * flashes), flashes - 1)
+                if step != last_step[0]:
+                    last_step[0] = step
+                    button.state(['pressed'] if step % 2 == 0 else ['!pressed'])
             
-            pulse()
+            def done():
+                button.state(['!pressed'])
         else:
             # For regular tk buttons
             original_bg = button.cget('bg')
             
-            def pulse(count=0):
-                if count < 3:  # Pulse 3 times
-                    color = color1 if count % 2 == 0 else color2
-                    button.configure(bg=color)
-                    self.root.after(duration//6, lambda: pulse(count + 1))
-                else:
-                    button.configure(bg=original_bg)
+            def apply(progress):
+                step = min(int(progress * flashes), flashes - 1)
+                if step != last_step[0]:
+                    last_step[0] = step
+                    button.configure(bg=color1 if step % 2 == 0 else color2)
             
-            pulse()
+            def done():
+                button.configure(bg=original_bg)
+        
+        self.add(Animation(duration * flashes // 6, apply, done))
     
     def slide_in(self, widget, direction='left', duration=300):
         """Slide in a widget from a direction."""
         original_x = widget.winfo_x()
         original_y = widget.winfo_y()
         
-        if direction == 'left':
-            widget.place(x=-widget.winfo_width(), y=original_y)
-        elif direction == 'right':
-            widget.place(x=self.root.winfo_width(), y=original_y)
-        elif direction == 'top':
-            widget.place(x=original_x, y=-widget.winfo_height())
-        elif direction == 'bottom':
-            widget.place(x=original_x, y=self.root.winfo_height())
+        def apply(progress):
+            if direction == 'left':
+                x = -widget.winfo_width() + (original_x + widget.winfo_width()) * progress
+                widget.place(x=x, y=original_y)
+            elif direction == 'right':
+                x = self.root.winfo_width() - (self.root.winfo_width() - original_x) * progress
+                widget.place(x=x, y=original_y)
+            elif direction == 'top':
+                y = -widget.winfo_height() + (original_y + widget.winfo_height()) * progress
+                widget.place(x=original_x, y=y)
+            elif direction == 'bottom':
+                y = self.root.winfo_height() - (self.root.winfo_height() - original_y) * progress
+                widget.place(x=original_x, y=y)
         
-        def animate(progress=0.0):
-            if progress < 1.0:
-                if direction == 'left':
-                    x = -widget.winfo_width() + (original_x + widget.winfo_width()) * progress
-                    widget.place(x=x, y=original_y)
-                elif direction == 'right':
-                    x = self.root.winfo_width() - (self.root.winfo_width() - original_x) * progress
-                    widget.place(x=x, y=original_y)
-                elif direction == 'top':
-                    y = -widget.winfo_height() + (original_y + widget.winfo_height()) * progress
-                    widget.place(x=original_x, y=y)
-                elif direction == 'bottom':
-                    y = self.root.winfo_height() - (self.root.winfo_height() - original_y) * progress
-                    widget.place(x=original_x, y=y)
-                
-                progress += 0.05
-                self.root.after(15, lambda: animate(progress))
-            else:
-                widget.place(x=original_x, y=original_y)
+        def done():
+            widget.place(x=original_x, y=original_y)
         
-        animate()
+        self.add(Animation(duration, apply, done))
 
 # ============================================================================
 # INTERACTIVE ELEMENTS
@@ -387,39 +422,45 @@ class StatusBar(tk.Frame):
 # WAVEFORM ENHANCEMENTS
 # ============================================================================
 
+# Built once at import; read-only so callers can't alter the shared scheme
+WAVEFORM_COLORS = MappingProxyType({
+    'waveform': WAVEFORM_COLOR,
+    'waveform_highlight': WAVEFORM_HIGHLIGHT,
+    'playhead': PLAYHEAD_COLOR,
+    'split_line': SPLIT_LINE_COLOR,
+    'split_line_active': SPLIT_LINE_ACTIVE,
+    'background': BG_PRIMARY,
+    'grid': BG_LIGHT
+})
+
 def get_waveform_colors():
     """Get color scheme for waveform display."""
-    return {
-        'waveform': WAVEFORM_COLOR,
-        'waveform_highlight': WAVEFORM_HIGHLIGHT,
-        'playhead': PLAYHEAD_COLOR,
-        'split_line': SPLIT_LINE_COLOR,
-        'split_line_active': SPLIT_LINE_ACTIVE,
-        'background': BG_PRIMARY,
-        'grid': BG_LIGHT
-    }
+    return WAVEFORM_COLORS
+
+@lru_cache(maxsize=64)
+def hex_to_rgb(hex_color):
+    """Convert a '#RRGGBB' color to an (r, g, b) tuple; the palette is small, so results are cached."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 def create_gradient_colors(start_color, end_color, steps=10):
     """Create a gradient between two colors."""
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
-    def rgb_to_hex(rgb):
-        return '#{:02x}{:02x}{:02x}'.format(*rgb)
-    
+    # Copy so callers can't mutate the cached gradient
+    return list(_gradient_colors(start_color, end_color, steps))
+
+@lru_cache(maxsize=64)
+def _gradient_colors(start_color, end_color, steps):
+    """Compute a gradient once per (start, end, steps) and cache it as a tuple."""
     start_rgb = hex_to_rgb(start_color)
     end_rgb = hex_to_rgb(end_color)
+    deltas = [e - s for s, e in zip(start_rgb, end_rgb)]
     
     colors = []
     for i in range(steps):
         ratio = i / (steps - 1)
-        r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-        g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-        b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
-        colors.append(rgb_to_hex((r, g, b)))
+        colors.append('#%02x%02x%02x' % tuple(int(s + d * ratio) for s, d in zip(start_rgb, deltas)))
     
-    return colors
+    return tuple(colors)
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -427,24 +468,30 @@ def create_gradient_colors(start_color, end_color, steps=10):
 
 def create_tooltip(widget, text):
     """Create a tooltip for a widget."""
+    # The tooltip window is built on first hover and then only shown/hidden
+    widget._tooltip = None
+    
     def show_tooltip(event):
-        tooltip = tk.Toplevel()
-        tooltip.wm_overrideredirect(True)
+        tooltip = widget._tooltip
+        if tooltip is None:
+            tooltip = widget._tooltip = tk.Toplevel(widget)
+            tooltip.wm_overrideredirect(True)
+            
+            label = tk.Label(tooltip, text=text, 
+                            bg=BG_DARK, fg=TEXT_LIGHT, 
+                            font=FONTS['caption'],
+                            relief='solid', borderwidth=1)
+            label.pack()
+            tooltip.bind('<Leave>', hide_tooltip)
         tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-        
-        label = tk.Label(tooltip, text=text, 
-                        bg=BG_DARK, fg=TEXT_LIGHT, 
-                        font=FONTS['caption'],
-                        relief='solid', borderwidth=1)
-        label.pack()
-        
-        def hide_tooltip():
-            tooltip.destroy()
-        
-        widget.bind('<Leave>', lambda e: hide_tooltip())
-        tooltip.bind('<Leave>', lambda e: hide_tooltip())
+        tooltip.deiconify()
+    
+    def hide_tooltip(event=None):
+        if widget._tooltip is not None:
+            widget._tooltip.withdraw()
     
     widget.bind('<Enter>', show_tooltip)
+    widget.bind('<Leave>', hide_tooltip)
 
 def add_hover_effect(widget, hover_bg, normal_bg):
     """Add simple hover effect to any widget."""